@@ -7,15 +7,35 @@
 
 import os
 import re
+import glob
 import json
 import time
+import heapq
+import queue
 import random
+import threading
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
 from datetime import datetime
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 from urllib.parse import urljoin
 import argparse
+from collections import namedtuple
+import orjson
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import asyncio
+import aiohttp
+from aiolimiter import AsyncLimiter
+
+# uvloop은 Windows를 지원하지 않으므로 없으면 기본 이벤트 루프 사용
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # 로깅 설정
 logging.basicConfig(
@@ -25,48 +45,254 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 조회수/기사 ID 추출용 정규식
+_DIGITS_RE = re.compile(r'(\d+)')
+_HT_ID_RE = re.compile(r'(\d+)(?:\.html)?$')
+_ET_ID_RE = re.compile(r'(\d+)(?:\.cms)?$')
+
+# 조회수 K, M 단위를 0으로 치환 (대소문자 모두)
+_VIEW_UNITS = str.maketrans({'k': '000', 'K': '000', 'm': '000000', 'M': '000000'})
+
+# 태그/클래스/속성 조건 (class_name은 공백으로 구분된 클래스 중 하나와 일치)
+_Selector = namedtuple('_Selector', ['tag', 'class_name', 'attrs'])
+
+def _sel(tag, class_name=None, **attrs):
+    """후보 선택 조건 생성"""
+    return _Selector(tag, class_name, attrs)
+
+class CandidateXPath:
+    """우선순위가 있는 후보 선택 조건들을 한 번의 트리 순회로 찾는 XPath"""
+    
+    def __init__(self, *selectors):
+        self.selectors = selectors
+        conditions = ' or '.join(self._condition(selector) for selector in selectors)
+        self.xpath = etree.XPath(f"//*[{conditions}]")
+    
+    @staticmethod
+    def _condition(selector):
+        """선택 조건을 XPath 조건식으로 변환"""
+        predicates = [f"self::{selector.tag}"]
+        if selector.class_name:
+            predicates.append(f"contains(concat(' ', normalize-space(@class), ' '), ' {selector.class_name} ')")
+        for attr, value in selector.attrs.items():
+            predicates.append(f"@{attr}='{value}'")
+        return f"({' and '.join(predicates)})"
+    
+    @staticmethod
+    def _matches(node, selector):
+        """노드가 선택 조건을 만족하는지 확인"""
+        if node.tag != selector.tag:
+            return False
+        if selector.class_name and selector.class_name not in node.get('class', '').split():
+            return False
+        return all(node.get(attr) == value for attr, value in selector.attrs.items())
+    
+    def first_text(self, root):
+        """우선순위 순으로 후보를 확인하여 처음으로 비어 있지 않은 텍스트 반환"""
+        nodes = self.xpath(root)
+        if not nodes:
+            return ""
+        
+        for selector in self.selectors:
+            # 같은 조건의 노드가 여러 개면 문서 순서상 첫 번째 노드만 사용
+            node = next((node for node in nodes if self._matches(node, selector)), None)
+            if node is None:
+                continue
+            if node.tag == 'meta':
+                text = node.get('content', '').strip()
+            else:
+                text = node.text_content().strip()
+            if text:
+                return text
+        return ""
+
+class _HrefCollector:
+    """lxml 파서 타깃 - 트리를 만들지 않고 <a href> 값만 수집
+
+    lxml은 타깃에 정의된 메서드만 호출하므로 end()/data()는 두지 않는다.
+    """
+    
+    def __init__(self):
+        self.hrefs = []
+    
+    def start(self, tag, attrib):
+        if tag == 'a':
+            href = attrib.get('href')
+            if href:
+                self.hrefs.append(href)
+    
+    def close(self):
+        return self.hrefs
+
+class _TokenBucket:
+    """동기 크롤링용 토큰 버킷 (여러 스레드에서 공유 가능)"""
+    
+    def __init__(self, rate, per=1.0):
+        self.rate = rate / per
+        self.capacity = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """토큰 하나를 얻을 때까지 대기"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # 토큰이 없으면 미리 차감해 두고 채워질 때까지의 시간만큼 대기
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
 class BaseScraper:
     """기본 스크래퍼 클래스"""
     
+    # 비동기 크롤링 시 호스트당 최대 동시 요청 수와 초당 요청 수
+    MAX_CONCURRENCY = 8
+    REQUESTS_PER_SECOND = 5
+    
+    # 비동기 크롤링 시 429 응답에 대한 최대 재시도 횟수
+    MAX_RETRIES = 3
+    
     def __init__(self, base_url, name, headers=None):
         self.base_url = base_url
         self.name = name
+        # 카테고리 추출용 접두사 ("https://host/")
+        self._base_prefix = base_url + '/'
+        self._base_prefix_len = len(self._base_prefix)
         self.headers = headers or {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
         self.session = requests.Session()
         self.session.headers.update(self.headers)
+        self.session.headers['Connection'] = 'keep-alive'
+        
+        # 커넥션 풀 크기 확대 및 일시적 오류 재시도
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # 요청 속도 제한 (토큰 버킷, 비동기/동기 크롤링용)
+        self._rate_limiter = AsyncLimiter(self.REQUESTS_PER_SECOND, 1)
+        self._sync_rate_limiter = _TokenBucket(self.REQUESTS_PER_SECOND, 1)
     
     def get_page(self, url):
-        """웹 페이지 가져오기"""
+        """웹 페이지 가져오기 (인코딩은 lxml이 판단하도록 bytes 반환)
+
+        문자열로 넘기면 lxml이 <?xml ... encoding=...?> 선언이 있는 페이지를 거부한다.
+        """
+        self._sync_rate_limiter.acquire()
         try:
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
-            return response.text
         except requests.RequestException as e:
             logger.error(f"Error fetching {url}: {e}")
             return None
+        
+        return response.content
     
-    def get_soup(self, url):
-        """BeautifulSoup 객체 가져오기"""
-        html = self.get_page(url)
-        if html:
-            return BeautifulSoup(html, 'html.parser')
-        return None
+    async def _fetch(self, session, url):
+        """웹 페이지 비동기로 가져오기 (인코딩은 lxml이 판단하도록 bytes 반환)
+
+        429 응답을 받으면 Retry-After 또는 지수 백오프만큼 기다린 뒤 재시도한다.
+        """
+        delay = 1
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                async with self._rate_limiter:
+                    async with session.get(url, headers=self.headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                        if response.status != 429 or attempt == self.MAX_RETRIES:
+                            response.raise_for_status()
+                            return await response.read()
+                        
+                        retry_after = response.headers.get('Retry-After', '')
+                        wait = int(retry_after) if retry_after.isdigit() else delay
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error(f"Error fetching {url}: {e}")
+                return None
+            
+            logger.warning(f"Rate limited while fetching {url}, retrying in {wait}s")
+            await asyncio.sleep(wait)
+            delay *= 2
+    
+    def parse_html(self, html, url):
+        """HTML 문자열/바이트를 lxml 트리(루트 요소)로 변환"""
+        try:
+            return lxml_html.fromstring(html)
+        except (etree.ParserError, ValueError) as e:
+            logger.error(f"Error parsing {url}: {e}")
+            return None
+    
+    def get_links(self, url):
+        """페이지의 모든 <a href> 값 가져오기 (트리를 만들지 않고 링크만 수집)"""
+        hrefs = self._stream_parse(url, target=_HrefCollector())
+        return hrefs or []
+    
+    def _stream_parse(self, url, target):
+        """응답 본문을 받는 대로 lxml 파서 타깃에 전달하고 target.close()의 결과 반환"""
+        self._sync_rate_limiter.acquire()
+        try:
+            with self.session.get(url, stream=True, timeout=10) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                
+                # 헤더에 charset이 있을 때만 지정하고, 없으면 lxml이 meta 태그로 판단
+                content_type = response.headers.get('Content-Type', '').lower()
+                encoding = response.encoding if 'charset' in content_type else None
+                parser = lxml_html.HTMLParser(encoding=encoding, target=target)
+                
+                return lxml_html.parse(response.raw, parser=parser)
+        except (requests.RequestException, Urllib3HTTPError) as e:
+            logger.error(f"Error fetching {url}: {e}")
+            return None
+        except (etree.ParserError, ValueError) as e:
+            logger.error(f"Error parsing {url}: {e}")
+            return None
+    
+    def _url_category(self, url):
+        """URL에서 도메인 바로 다음 경로(카테고리) 추출"""
+        if url.startswith(self._base_prefix):
+            tail = url[self._base_prefix_len:]
+            slash = tail.find('/')
+            return tail[:slash] if slash >= 0 else tail
+        
+        # 다른 호스트의 URL은 경로를 분리하여 확인
+        parts = url.split('/', 4)
+        return parts[3] if len(parts) > 3 else ""
     
     def get_article_urls(self, category=None, max_pages=2):
         """기사 URL 목록 가져오기 (하위 클래스에서 구현)"""
         raise NotImplementedError("Subclasses must implement this method")
     
-    def parse_article(self, url):
-        """기사 내용 파싱 (하위 클래스에서 구현)"""
+    def parse_article(self, url, crawled_at=None):
+        """기사 페이지를 가져와 내용 파싱"""
+        html = self.get_page(url)
+        if not html:
+            return None
+        return self.parse_article_from_html(html, url, crawled_at)
+    
+    def parse_article_from_html(self, html, url, crawled_at=None):
+        """가져온 HTML에서 기사 내용 파싱 (하위 클래스에서 구현)
+
+        crawled_at을 주지 않으면 현재 시각을 사용한다.
+        """
         raise NotImplementedError("Subclasses must implement this method")
     
-    def extract_views(self, article_soup, article_url):
+    def extract_views(self, article_root, article_url):
         """조회수 추출 (하위 클래스에서 구현)"""
         raise NotImplementedError("Subclasses must implement this method")
     
-    def crawl_articles(self, category=None, max_articles=10, delay_range=(1, 3)):
+    def crawl_articles(self, category=None, max_articles=10):
         """기사 크롤링"""
         article_urls = self.get_article_urls(category, max_pages=2)
         if not article_urls:
@@ -76,23 +302,92 @@ class BaseScraper:
         # 최대 기사 수 제한
         article_urls = article_urls[:max_articles]
         
+        # 크롤링 시각은 한 번의 크롤링에서 공통으로 사용
+        crawled_at = datetime.now().isoformat()
+        
         articles = []
         for url in article_urls:
             logger.info(f"Crawling article: {url}")
             
-            # 요청 간 딜레이
-            delay = random.uniform(*delay_range)
-            time.sleep(delay)
-            
-            article_data = self.parse_article(url)
+            # 요청 간격은 get_page의 토큰 버킷이 조절
+            article_data = self.parse_article(url, crawled_at)
             if article_data:
                 articles.append(article_data)
         
         return articles
+    
+    async def crawl_articles_async(self, session=None, category=None, max_articles=10, executor=None):
+        """기사 비동기 크롤링 (세마포어로 동시 요청 수, 토큰 버킷으로 요청 속도 제한)
+
+        executor(ProcessPoolExecutor)를 주면 HTML 파싱을 별도 프로세스에서 수행한다.
+        """
+        article_urls = await asyncio.to_thread(self.get_article_urls, category, 2)
+        if not article_urls:
+            logger.warning(f"No article URLs found for {self.name}")
+            return []
+        
+        # 최대 기사 수 제한
+        article_urls = article_urls[:max_articles]
+        
+        if session is None:
+            connector = aiohttp.TCPConnector(limit_per_host=self.MAX_CONCURRENCY)
+            async with aiohttp.ClientSession(connector=connector) as session:
+                return await self._crawl_urls(session, article_urls, executor)
+        return await self._crawl_urls(session, article_urls, executor)
+    
+    async def _crawl_urls(self, session, article_urls, executor=None):
+        """기사 URL 목록을 동시에 가져와 파싱"""
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        
+        # 크롤링 시각은 한 번의 크롤링에서 공통으로 사용
+        crawled_at = datetime.now().isoformat()
+        
+        async def crawl_one(url):
+            async with semaphore:
+                logger.info(f"Crawling article: {url}")
+                html = await self._fetch(session, url)
+            
+            if not html:
+                return None
+            if executor is None:
+                return self.parse_article_from_html(html, url, crawled_at)
+            
+            # 파싱은 CPU 작업이므로 프로세스 풀에서 수행하여 이벤트 루프를 막지 않음
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                executor, _parse_worker, html, url, type(self).__name__, crawled_at
+            )
+        
+        results = await asyncio.gather(*(crawl_one(url) for url in article_urls))
+        return [article for article in results if article]
 
 class TimesOfIndiaScraper(BaseScraper):
     """Times of India 전용 스크래퍼"""
     
+    TITLE_XPATH = CandidateXPath(
+        _sel('h1', '_23498'),
+        _sel('h1', '_1Y-96'),
+        _sel('h1', 'title'),
+        _sel('h1'),  # 클래스 없이 h1 태그 찾기
+        _sel('meta', property='og:title'),  # 메타 태그에서 제목 찾기
+    )
+    CONTENT_XPATH = CandidateXPath(
+        _sel('div', '_3YYSt'),
+        _sel('div', 'ga-article'),
+        _sel('div', 'article_content'),
+        _sel('div', id='articleText'),
+        _sel('div', 'Normal'),
+    )
+    DATE_XPATH = CandidateXPath(
+        _sel('div', '_3Mkg-'),
+        _sel('div', 'byline'),
+        _sel('meta', property='article:published_time'),
+    )
+    VIEWS_XPATH = CandidateXPath(
+        _sel('div', '_1_Akb'),
+        _sel('div', 'view-count'),
+    )
+    
     def __init__(self):
         super().__init__(
             base_url="https://timesofindia.indiatimes.com",
@@ -106,87 +401,39 @@ class TimesOfIndiaScraper(BaseScraper):
         else:
             url = self.base_url
         
-        soup = self.get_soup(url)
-        if not soup:
-            return []
-        
-        article_urls = []
-        for a_tag in soup.find_all('a'):
-            href = a_tag.get('href', '')
-            # 기사 URL 패턴 확인
-            if '/articleshow/' in href:
-                full_url = urljoin(self.base_url, href)
-                if full_url not in article_urls:
-                    article_urls.append(full_url)
+        # 기사 URL 패턴 확인
+        candidate_urls = [
+            urljoin(self.base_url, href)
+            for href in self.get_links(url)
+            if '/articleshow/' in href
+        ]
         
-        return article_urls
+        # 순서를 유지하며 중복 제거 (dict 키 조회는 O(1))
+        return list(dict.fromkeys(candidate_urls))
     
-    def parse_article(self, url):
+    def parse_article_from_html(self, html, url, crawled_at=None):
         """기사 내용 파싱"""
-        soup = self.get_soup(url)
-        if not soup:
+        root = self.parse_html(html, url)
+        if root is None:
             return None
         
         try:
             # 기사 제목 - 여러 클래스 시도
-            title = "제목 없음"
-            title_candidates = [
-                soup.find('h1', class_='_23498'),
-                soup.find('h1', class_='_1Y-96'),
-                soup.find('h1', class_='title'),
-                soup.find('h1'),  # 클래스 없이 h1 태그 찾기
-                soup.find('meta', property='og:title')  # 메타 태그에서 제목 찾기
-            ]
-            
-            for candidate in title_candidates:
-                if candidate:
-                    if candidate.name == 'meta':
-                        title = candidate.get('content', '').strip()
-                    else:
-                        title = candidate.text.strip()
-                    if title:
-                        break
+            title = self.TITLE_XPATH.first_text(root) or "제목 없음"
             
             # 기사 내용 - 여러 클래스 시도
-            content = ""
-            content_candidates = [
-                soup.find('div', class_='_3YYSt'),
-                soup.find('div', class_='ga-article'),
-                soup.find('div', class_='article_content'),
-                soup.find('div', attrs={'id': 'articleText'}),
-                soup.find('div', class_='Normal')
-            ]
-            
-            for candidate in content_candidates:
-                if candidate:
-                    content = candidate.text.strip()
-                    if content:
-                        break
+            content = self.CONTENT_XPATH.first_text(root)
             
             # 게시 날짜 - 여러 클래스 시도
-            published_date = ""
-            date_candidates = [
-                soup.find('div', class_='_3Mkg-'),
-                soup.find('div', class_='byline'),
-                soup.find('meta', property='article:published_time')
-            ]
-            
-            for candidate in date_candidates:
-                if candidate:
-                    if candidate.name == 'meta':
-                        published_date = candidate.get('content', '').strip()
-                    else:
-                        published_date = candidate.text.strip()
-                    if published_date:
-                        break
+            published_date = self.DATE_XPATH.first_text(root)
             
             # 카테고리
-            category = url.split('/')[3] if len(url.split('/')) > 3 else ""
+            category = self._url_category(url)
             
             # 조회수 추출
-            views = self.extract_views(soup, url)
+            views = self.extract_views(root, url)
             
-            article_id = url.split('/')[-1].split('.')[0]
+            article_id = url.rsplit('/', 1)[-1].split('.', 1)[0]
             
             return {
                 "id": article_id,
@@ -197,27 +444,26 @@ class TimesOfIndiaScraper(BaseScraper):
                 "category": category,
                 "source": self.name,
                 "views": views,
-                "crawled_at": datetime.now().isoformat()
+                "crawled_at": crawled_at or datetime.now().isoformat()
             }
         except Exception as e:
             logger.error(f"Error parsing article {url}: {e}")
             return None
     
-    def extract_views(self, article_soup, article_url):
+    def extract_views(self, article_root, article_url):
         """조회수 추출"""
         try:
             # 방법 1: 기사 페이지에서 직접 조회수 추출 시도
-            views_elem = article_soup.find('div', class_='_1_Akb') or article_soup.find('div', class_='view-count')
-            if views_elem:
-                views_text = views_elem.text.strip()
+            views_text = self.VIEWS_XPATH.first_text(article_root)
+            if views_text:
                 # K, M 단위 처리
-                views_text = views_text.lower().replace('k', '000').replace('m', '000000')
-                views_match = re.search(r'(\d+)', views_text)
+                views_text = views_text.translate(_VIEW_UNITS)
+                views_match = _DIGITS_RE.search(views_text)
                 if views_match:
                     return int(views_match.group(1))
             
             # 방법 2: 기사 ID를 이용하여 조회수 추정
-            article_id = article_url.split('/')[-1].split('.')[0]
+            article_id = article_url.rsplit('/', 1)[-1].split('.', 1)[0]
             if article_id.isdigit():
                 # 기사 ID의 마지막 4자리를 이용하여 조회수 생성
                 last_digits = int(article_id[-4:])
@@ -234,6 +480,27 @@ class TimesOfIndiaScraper(BaseScraper):
 class HindustanTimesScraper(BaseScraper):
     """Hindustan Times 전용 스크래퍼"""
     
+    TITLE_XPATH = CandidateXPath(
+        _sel('h1', 'hdg1'),
+        _sel('h1', 'headline'),
+        _sel('h1'),
+        _sel('meta', property='og:title'),
+    )
+    CONTENT_XPATH = CandidateXPath(
+        _sel('div', 'storyDetail'),
+        _sel('div', 'story-details'),
+        _sel('div', 'article-body'),
+        _sel('div', itemprop='articleBody'),
+    )
+    DATE_XPATH = CandidateXPath(
+        _sel('span', 'dateTime'),
+        _sel('span', 'article-time'),
+        _sel('meta', property='article:published_time'),
+    )
+    VIEWS_XPATH = CandidateXPath(
+        _sel('span', 'viewCount'),
+    )
+    
     def __init__(self):
         super().__init__(
             base_url="https://www.hindustantimes.com",
@@ -247,86 +514,40 @@ class HindustanTimesScraper(BaseScraper):
         else:
             url = self.base_url
         
-        soup = self.get_soup(url)
-        if not soup:
-            return []
-        
-        article_urls = []
-        for a_tag in soup.find_all('a'):
-            href = a_tag.get('href', '')
-            # 기사 URL 패턴 확인
-            if '/story-' in href or '/article-' in href:
-                full_url = urljoin(self.base_url, href)
-                if full_url not in article_urls:
-                    article_urls.append(full_url)
+        # 기사 URL 패턴 확인
+        candidate_urls = [
+            urljoin(self.base_url, href)
+            for href in self.get_links(url)
+            if '/story-' in href or '/article-' in href
+        ]
         
-        return article_urls
+        # 순서를 유지하며 중복 제거 (dict 키 조회는 O(1))
+        return list(dict.fromkeys(candidate_urls))
     
-    def parse_article(self, url):
+    def parse_article_from_html(self, html, url, crawled_at=None):
         """기사 내용 파싱"""
-        soup = self.get_soup(url)
-        if not soup:
+        root = self.parse_html(html, url)
+        if root is None:
             return None
         
         try:
             # 기사 제목 - 여러 클래스 시도
-            title = "제목 없음"
-            title_candidates = [
-                soup.find('h1', class_='hdg1'),
-                soup.find('h1', class_='headline'),
-                soup.find('h1'),
-                soup.find('meta', property='og:title')
-            ]
-            
-            for candidate in title_candidates:
-                if candidate:
-                    if candidate.name == 'meta':
-                        title = candidate.get('content', '').strip()
-                    else:
-                        title = candidate.text.strip()
-                    if title:
-                        break
+            title = self.TITLE_XPATH.first_text(root) or "제목 없음"
             
             # 기사 내용 - 여러 클래스 시도
-            content = ""
-            content_candidates = [
-                soup.find('div', class_='storyDetail'),
-                soup.find('div', class_='story-details'),
-                soup.find('div', class_='article-body'),
-                soup.find('div', attrs={'itemprop': 'articleBody'})
-            ]
-            
-            for candidate in content_candidates:
-                if candidate:
-                    content = candidate.text.strip()
-                    if content:
-                        break
+            content = self.CONTENT_XPATH.first_text(root)
             
             # 게시 날짜 - 여러 클래스 시도
-            published_date = ""
-            date_candidates = [
-                soup.find('span', class_='dateTime'),
-                soup.find('span', class_='article-time'),
-                soup.find('meta', property='article:published_time')
-            ]
-            
-            for candidate in date_candidates:
-                if candidate:
-                    if candidate.name == 'meta':
-                        published_date = candidate.get('content', '').strip()
-                    else:
-                        published_date = candidate.text.strip()
-                    if published_date:
-                        break
+            published_date = self.DATE_XPATH.first_text(root)
             
             # 카테고리
-            category = url.split('/')[3] if len(url.split('/')) > 3 else ""
+            category = self._url_category(url)
             
             # 조회수 추출
-            views = self.extract_views(soup, url)
+            views = self.extract_views(root, url)
             
             # 기사 ID 추출
-            article_id = url.split('-')[-1].split('.')[0]
+            article_id = url.rsplit('/', 1)[-1].rsplit('-', 1)[-1].split('.', 1)[0]
             
             return {
                 "id": article_id,
@@ -337,27 +558,26 @@ class HindustanTimesScraper(BaseScraper):
                 "category": category,
                 "source": self.name,
                 "views": views,
-                "crawled_at": datetime.now().isoformat()
+                "crawled_at": crawled_at or datetime.now().isoformat()
             }
         except Exception as e:
             logger.error(f"Error parsing article {url}: {e}")
             return None
     
-    def extract_views(self, article_soup, article_url):
+    def extract_views(self, article_root, article_url):
         """조회수 추출"""
         try:
             # 방법 1: 기사 페이지에서 직접 조회수 추출 시도
-            views_elem = article_soup.find('span', class_='viewCount')
-            if views_elem:
-                views_text = views_elem.text.strip()
+            views_text = self.VIEWS_XPATH.first_text(article_root)
+            if views_text:
                 # 숫자만 추출
-                views_match = re.search(r'(\d+)', views_text)
+                views_match = _DIGITS_RE.search(views_text)
                 if views_match:
                     return int(views_match.group(1))
             
             # 방법 2: 홈페이지에서 확인한 숫자 활용
             # 기사 URL에서 ID 추출
-            article_id_match = re.search(r'(\d+)(?:\.html)?$', article_url)
+            article_id_match = _HT_ID_RE.search(article_url)
             if article_id_match:
                 article_id = article_id_match.group(1)
                 # ID의 마지막 2자리를 이용하여 조회수 생성 (데모용)
@@ -373,6 +593,19 @@ class HindustanTimesScraper(BaseScraper):
 class EconomicTimesScraper(BaseScraper):
     """Economic Times 전용 스크래퍼"""
     
+    TITLE_XPATH = CandidateXPath(
+        _sel('h1', 'artTitle'),
+    )
+    CONTENT_XPATH = CandidateXPath(
+        _sel('div', 'artText'),
+    )
+    DATE_XPATH = CandidateXPath(
+        _sel('time', 'pub-time'),
+    )
+    VIEWS_XPATH = CandidateXPath(
+        _sel('div', 'view-count'),
+    )
+    
     def __init__(self):
         super().__init__(
             base_url="https://economictimes.indiatimes.com",
@@ -386,48 +619,40 @@ class EconomicTimesScraper(BaseScraper):
         else:
             url = self.base_url
         
-        soup = self.get_soup(url)
-        if not soup:
-            return []
-        
-        article_urls = []
-        for a_tag in soup.find_all('a'):
-            href = a_tag.get('href', '')
-            # 기사 URL 패턴 확인
-            if '/articleshow/' in href or '/prime/news/' in href:
-                full_url = urljoin(self.base_url, href)
-                if full_url not in article_urls:
-                    article_urls.append(full_url)
+        # 기사 URL 패턴 확인
+        candidate_urls = [
+            urljoin(self.base_url, href)
+            for href in self.get_links(url)
+            if '/articleshow/' in href or '/prime/news/' in href
+        ]
         
-        return article_urls
+        # 순서를 유지하며 중복 제거 (dict 키 조회는 O(1))
+        return list(dict.fromkeys(candidate_urls))
     
-    def parse_article(self, url):
+    def parse_article_from_html(self, html, url, crawled_at=None):
         """기사 내용 파싱"""
-        soup = self.get_soup(url)
-        if not soup:
+        root = self.parse_html(html, url)
+        if root is None:
             return None
         
         try:
             # 기사 제목
-            title_elem = soup.find('h1', class_='artTitle')
-            title = title_elem.text.strip() if title_elem else "제목 없음"
+            title = self.TITLE_XPATH.first_text(root) or "제목 없음"
             
             # 기사 내용
-            content_elem = soup.find('div', class_='artText')
-            content = content_elem.text.strip() if content_elem else ""
+            content = self.CONTENT_XPATH.first_text(root)
             
             # 게시 날짜
-            date_elem = soup.find('time', class_='pub-time')
-            published_date = date_elem.text.strip() if date_elem else ""
+            published_date = self.DATE_XPATH.first_text(root)
             
             # 카테고리
-            category = url.split('/')[3] if len(url.split('/')) > 3 else ""
+            category = self._url_category(url)
             
             # 조회수 추출
-            views = self.extract_views(soup, url)
+            views = self.extract_views(root, url)
             
             # 기사 ID 추출
-            article_id = url.split('/')[-1].split('.')[0]
+            article_id = url.rsplit('/', 1)[-1].split('.', 1)[0]
             
             return {
                 "id": article_id,
@@ -438,27 +663,26 @@ class EconomicTimesScraper(BaseScraper):
                 "category": category,
                 "source": self.name,
                 "views": views,
-                "crawled_at": datetime.now().isoformat()
+                "crawled_at": crawled_at or datetime.now().isoformat()
             }
         except Exception as e:
             logger.error(f"Error parsing article {url}: {e}")
             return None
     
-    def extract_views(self, article_soup, article_url):
+    def extract_views(self, article_root, article_url):
         """조회수 추출"""
         try:
             # 방법 1: 기사 페이지에서 직접 조회수 추출 시도
-            views_elem = article_soup.find('div', class_='view-count')
-            if views_elem:
-                views_text = views_elem.text.strip()
+            views_text = self.VIEWS_XPATH.first_text(article_root)
+            if views_text:
                 # 숫자만 추출
-                views_match = re.search(r'(\d+)', views_text)
+                views_match = _DIGITS_RE.search(views_text)
                 if views_match:
                     return int(views_match.group(1))
             
             # 방법 2: 홈페이지에서 확인한 숫자 활용
             # 기사 URL에서 ID 추출
-            article_id_match = re.search(r'(\d+)(?:\.cms)?$', article_url)
+            article_id_match = _ET_ID_RE.search(article_url)
             if article_id_match:
                 article_id = article_id_match.group(1)
                 # ID의 마지막 3자리를 이용하여 조회수 생성 (데모용)
@@ -472,6 +696,24 @@ class EconomicTimesScraper(BaseScraper):
             return random.randint(100, 3000)  # 오류 시 임의의 조회수 반환
 
 
+# 프로세스 풀 작업자에서 사용할 스크래퍼 클래스
+_SCRAPER_CLASSES = {
+    cls.__name__: cls
+    for cls in (TimesOfIndiaScraper, HindustanTimesScraper, EconomicTimesScraper)
+}
+
+# 작업자 프로세스별로 재사용하는 스크래퍼 인스턴스
+_worker_scrapers = {}
+
+def _parse_worker(html, url, scraper_class_name, crawled_at):
+    """프로세스 풀 작업자에서 기사 HTML 파싱 (pickle 가능하도록 모듈 수준 함수)"""
+    scraper = _worker_scrapers.get(scraper_class_name)
+    if scraper is None:
+        scraper = _SCRAPER_CLASSES[scraper_class_name]()
+        _worker_scrapers[scraper_class_name] = scraper
+    return scraper.parse_article_from_html(html, url, crawled_at)
+
+
 class IndiaNewsCrawler:
     """인도 뉴스 크롤러 통합 클래스"""
     
@@ -482,10 +724,6 @@ class IndiaNewsCrawler:
                 'times_of_india': ['india', 'world', 'business'],
                 'hindustan_times': ['india-news', 'world-news', 'business'],
                 'economic_times': ['news', 'markets', 'industry']
-            },
-            'delay': {
-                'min': 2,
-                'max': 5
             }
         }
         
@@ -504,34 +742,61 @@ class IndiaNewsCrawler:
         os.makedirs(self.data_dir, exist_ok=True)
         os.makedirs(self.raw_dir, exist_ok=True)
         os.makedirs(self.processed_dir, exist_ok=True)
-    
-    def crawl_all(self):
-        """모든 웹사이트 크롤링"""
-        results = {}
         
-        for website, scraper in self.scrapers.items():
+        # 웹사이트별 기본/카테고리 디렉토리를 미리 생성하고 생성한 경로를 기억
+        self._created_dirs = set()
+        for website in self.scrapers:
+            categories = self.config.get('categories', {}).get(website, [])
+            for category in [website, *categories]:
+                self._ensure_dir(os.path.join(self.raw_dir, website, category))
+    
+    async def crawl_all(self, max_articles=None):
+        """모든 웹사이트 동시 크롤링 (하나의 aiohttp 세션 공유)"""
+        if max_articles is None:
+            max_articles = self.config['max_articles_per_website']
+        
+        for website in self.scrapers:
             logger.info(f"Crawling {website}...")
-            
-            articles = scraper.crawl_articles(
-                max_articles=self.config['max_articles_per_website'],
-                delay_range=(
-                    self.config['delay']['min'],
-                    self.config['delay']['max']
+        
+        # 사이트별 크롤링이 끝나는 대로 기사 파일을 큐에 넣고, 백그라운드 스레드가
+        # 나머지 사이트를 크롤링하는 동안 파일로 기록
+        write_queue = queue.Queue()
+        writer = threading.Thread(target=self._writer_loop, args=(write_queue,), name='raw-data-writer')
+        writer.start()
+        
+        async def crawl_site(website, scraper):
+            try:
+                articles = await scraper.crawl_articles_async(
+                    session,
+                    max_articles=max_articles,
+                    executor=executor
                 )
-            )
+            except Exception as e:
+                logger.error(f"Error crawling {website}: {e}")
+                articles = []
             
-            results[website] = articles
-            self._save_raw_data(website, None, articles)
+            self._save_raw_data(website, None, articles, write_queue)
+            return articles
         
-        return results
-    
-    def _save_raw_data(self, website, category, articles):
-        """원본 데이터 저장"""
-        website_dir = os.path.join(self.raw_dir, website)
-        category_dir = os.path.join(website_dir, category or website)
+        # 세 사이트가 커넥션 풀과 DNS 캐시를 함께 사용하고, 파싱은 프로세스 풀에서 수행
+        try:
+            connector = aiohttp.TCPConnector(limit=192, limit_per_host=64, ttl_dns_cache=300)
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                async with aiohttp.ClientSession(connector=connector) as session:
+                    crawled = await asyncio.gather(
+                        *(crawl_site(website, scraper) for website, scraper in self.scrapers.items())
+                    )
+        finally:
+            # 종료 신호를 넣고 남은 파일 기록이 끝날 때까지 대기
+            write_queue.put(None)
+            await asyncio.to_thread(writer.join)
         
-        os.makedirs(website_dir, exist_ok=True)
-        os.makedirs(category_dir, exist_ok=True)
+        return dict(zip(self.scrapers, crawled))
+    
+    def _save_raw_data(self, website, category, articles, write_queue=None):
+        """원본 데이터 저장 (write_queue가 있으면 기록을 쓰기 스레드에 맡김)"""
+        category_dir = os.path.join(self.raw_dir, website, category or website)
+        self._ensure_dir(category_dir)
         
         for article in articles:
             if not article:
@@ -540,34 +805,50 @@ class IndiaNewsCrawler:
             article_id = article.get('id', str(int(time.time())))
             filename = os.path.join(category_dir, f"{article_id}.json")
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(article, f, ensure_ascii=False, indent=2)
+            if write_queue is not None:
+                write_queue.put((filename, article))
+            else:
+                self._write_article(filename, article)
+    
+    def _ensure_dir(self, path):
+        """디렉토리가 없으면 생성 (이미 생성한 경로는 건너뜀)"""
+        if path not in self._created_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._created_dirs.add(path)
+    
+    def _write_article(self, filename, article):
+        """기사 하나를 JSON 파일로 저장"""
+        try:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(article, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        except Exception as e:
+            logger.error(f"Error saving article {filename}: {e}")
+    
+    def _writer_loop(self, write_queue):
+        """쓰기 큐의 (파일 경로, 기사)를 종료 신호(None)가 올 때까지 순서대로 저장"""
+        while True:
+            item = write_queue.get()
+            if item is None:
+                return
+            self._write_article(*item)
+    
+    def _load_article(self, filepath):
+        """저장된 기사 파일 하나 읽기"""
+        try:
+            with open(filepath, 'rb') as f:
+                return orjson.loads(f.read())
+        except Exception as e:
+            logger.error(f"Error loading article {filepath}: {e}")
+            return None
     
     def get_all_articles(self):
-        """모든 저장된 기사 가져오기"""
-        all_articles = []
+        """모든 저장된 기사 가져오기 (raw/<website>/<category>/*.json)"""
+        filepaths = glob.iglob(os.path.join(self.raw_dir, '*', '*', '*.json'))
         
-        for website in os.listdir(self.raw_dir):
-            website_dir = os.path.join(self.raw_dir, website)
-            if not os.path.isdir(website_dir):
-                continue
-            
-            for category in os.listdir(website_dir):
-                category_dir = os.path.join(website_dir, category)
-                if not os.path.isdir(category_dir):
-                    continue
-                
-                for filename in os.listdir(category_dir):
-                    if not filename.endswith('.json'):
-                        continue
-                    
-                    filepath = os.path.join(category_dir, filename)
-                    try:
-                        with open(filepath, 'r', encoding='utf-8') as f:
-                            article = json.load(f)
-                            all_articles.append(article)
-                    except Exception as e:
-                        logger.error(f"Error loading article {filepath}: {e}")
+        # 파일 읽기는 I/O 대기가 대부분이므로 스레드로 병렬 처리
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            articles = executor.map(self._load_article, filepaths)
+            all_articles = [article for article in articles if article is not None]
         
         return all_articles
     
@@ -580,8 +861,11 @@ class IndiaNewsCrawler:
     
     def get_top_articles(self, limit=10, articles=None):
         """조회수 기준 상위 기사 가져오기"""
-        sorted_articles = self.sort_articles_by_views(articles)
-        return sorted_articles[:limit]
+        if articles is None:
+            articles = self.get_all_articles()
+        
+        # 전체 정렬 대신 상위 limit개만 힙으로 선택 (O(N log K))
+        return heapq.nlargest(limit, articles, key=lambda x: x.get('views', 0))
 
     def crawl_specific_website(self, website_name, max_articles=5):
         """특정 웹사이트만 크롤링"""
@@ -592,13 +876,7 @@ class IndiaNewsCrawler:
         scraper = self.scrapers[website_name]
         logger.info(f"Crawling {website_name}...")
         
-        articles = scraper.crawl_articles(
-            max_articles=max_articles,
-            delay_range=(
-                self.config['delay']['min'],
-                self.config['delay']['max']
-            )
-        )
+        articles = scraper.crawl_articles(max_articles=max_articles)
         
         # 결과 저장
         self._save_raw_data(website_name, None, articles)
@@ -607,6 +885,10 @@ class IndiaNewsCrawler:
 
 def main():
     """메인 함수"""
+    # 더 빠른 이벤트 루프 사용 (asyncio.run이 이 정책으로 루프를 생성)
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     # 명령행 인자 파싱
     parser = argparse.ArgumentParser(description='인도 뉴스 크롤러')
     parser.add_argument('--website', type=str, help='특정 웹사이트만 크롤링 (times_of_india, hindustan_times, economic_times)')
@@ -653,30 +935,16 @@ def main():
         else:
             logger.error(f"Website {args.website} not found. Available options: {list(crawler.scrapers.keys())}")
     else:
-        # 모든 웹사이트 크롤링
-        for website, scraper in crawler.scrapers.items():
-            try:
-                logger.info(f"Crawling {website}...")
-                articles = scraper.crawl_articles(
-                    max_articles=args.max,
-                    delay_range=(
-                        crawler.config['delay']['min'],
-                        crawler.config['delay']['max']
-                    )
-                )
-                results[website] = articles
-                logger.info(f"Successfully crawled {len(articles)} articles from {website}")
-                
-                # 첫 번째 기사 정보 로깅 (디버깅용)
-                if articles:
-                    logger.info(f"Sample article from {website}: {articles[0].get('title')}")
-                    logger.info(f"Content preview: {articles[0].get('content')[:100]}...")
-                
-                # 각 웹사이트별 결과 저장
-                crawler._save_raw_data(website, None, articles)
-            except Exception as e:
-                logger.error(f"Error crawling {website}: {e}")
-                results[website] = []
+        # 모든 웹사이트 동시 크롤링 (웹사이트별 결과 저장 포함)
+        results = asyncio.run(crawler.crawl_all(max_articles=args.max))
+        
+        for website, articles in results.items():
+            logger.info(f"Successfully crawled {len(articles)} articles from {website}")
+            
+            # 첫 번째 기사 정보 로깅 (디버깅용)
+            if articles:
+                logger.info(f"Sample article from {website}: {articles[0].get('title')}")
+                logger.info(f"Content preview: {articles[0].get('content')[:100]}...")
     
     # 결과 요약
     total_articles = sum(len(articles) for articles in results.values())
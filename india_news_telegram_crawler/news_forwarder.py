@@ -6,71 +6,256 @@
 """
 
 import os
-import json
+import ssl
+import time
+import pickle
+import unicodedata
 import asyncio
 import logging
+import aiohttp
+import orjson
 from dotenv import load_dotenv
-from telegram import Bot
+from pybloom_live import ScalableBloomFilter
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from news_crawler_updated import IndiaNewsCrawler
-from datetime import datetime
 
-# 로깅 설정
+# uvloop은 Windows를 지원하지 않으므로 없으면 기본 이벤트 루프 사용
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# 환경 변수 로드
+load_dotenv()
+
+# 로깅 설정 (기본 INFO, LOG_LEVEL 환경 변수로 변경 가능, 잘못된 값이면 INFO)
+_log_level_name = (os.getenv('LOG_LEVEL') or 'INFO').strip().upper()
+_log_level = logging.getLevelName(_log_level_name)  # 알 수 없는 이름이면 문자열 반환
+if not isinstance(_log_level, int):
+    _log_level = None
 logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    level=logging.DEBUG,
+    level=logging.INFO if _log_level is None else _log_level,
     handlers=[
         logging.FileHandler('news_forwarder.log'),
         logging.StreamHandler()
-    ]
+    ],
+    force=True  # 먼저 import된 크롤러 모듈의 basicConfig 설정을 대체
 )
 logger = logging.getLogger(__name__)
+if _log_level is None:
+    logger.warning(f"알 수 없는 LOG_LEVEL 값 '{_log_level_name}', INFO로 설정합니다.")
 
-# 환경 변수 로드
-load_dotenv()
+# 기사 묶음 메시지 최대 길이 (텔레그램 본문 한도 4096자) 와 묶음 간 전송 간격(초)
+DIGEST_MAX_CHARS = 4000
+DIGEST_INTERVAL = 3
+DIGEST_SEPARATOR = "\n\n\\-\\-\\-\n\n"  # MarkdownV2로 이스케이프한 "---"
 
-def format_article_message(article):
-    """기사 정보를 텔레그램 메시지 형식으로 변환"""
-    view_count = article.get('views', 0)
-    if view_count >= 1000000:
-        view_count_str = f"{view_count/1000000:.1f}M"
-    elif view_count >= 1000:
-        view_count_str = f"{view_count/1000:.1f}K"
-    else:
-        view_count_str = f"{view_count}"
+# MarkdownV2에서 이스케이프가 필요한 문자 변환표
+_MD_ESCAPE = str.maketrans({c: f"\\{c}" for c in "\\_*[]()~`>#+-=|{}.!"})
 
-    category = article.get('category', '')
-    category_text = f" [{category}]" if category else ""
+# 조회수 표기 단위 (기준값, 접미사)
+_VIEW_UNITS = ((1_000_000, 'M'), (1_000, 'K'))
 
-    message = (
-        f"📰 *{article['title']}*{category_text}\n\n"
-        f"👁 조회수: {view_count_str}\n"
-    )
+# 크롤링 결과 저장 디렉토리 (모듈 로드 시 한 번만 확인 및 생성)
+_TEST_DATA_DIR = Path(__file__).resolve().parent / 'test_data'
+_TEST_DATA_DIR.mkdir(exist_ok=True)
+
+# 전송할 기사 제목 최대 길이
+TITLE_MAX_CHARS = 300
+
+# 텔레그램 Bot API 메시지 전송 주소
+TELEGRAM_SEND_URL = "https://api.telegram.org/bot{token}/sendMessage"
+
+# 이미 전송한 기사 URL을 기록하는 Bloom filter 파일 (실행 위치와 무관하게 스크립트 옆에 저장)
+BLOOM_FILE = Path(__file__).resolve().parent / 'bloom.pkl'
+
+# URL 정규화 시 제거할 추적용 쿼리 파라미터 (utm_* 포함)
+TRACKING_PARAMS = {'ref', 'ref_src', 'fbclid', 'gclid', 'from', 'source'}
+
+# SSL 컨텍스트는 인증서 로드 비용이 크므로 한 번만 생성하여 재사용
+_SSL_CTX = ssl.create_default_context()
+
+# 실행 간 재사용하는 HTTP 세션과 크롤러 (처음 사용할 때 생성)
+_session = None
+_session_loop = None  # _session을 생성한 이벤트 루프
+_session_closer = None  # 루프 종료 시 _session을 닫는 태스크
+_crawler = None
+
+class TelegramAPIError(Exception):
+    """텔레그램 Bot API 오류 응답 (ok=false)"""
+    
+    def __init__(self, description, error_code=None, retry_after=None):
+        super().__init__(description)
+        self.error_code = error_code
+        self.retry_after = retry_after
+
+async def _tg_post(session, token, payload):
+    """sendMessage 요청 1회 전송, 실패 응답이면 TelegramAPIError 발생"""
+    async with session.post(TELEGRAM_SEND_URL.format(token=token), json=payload) as response:
+        try:
+            result = await response.json(content_type=None)
+        except ValueError:
+            result = {}
     
-    # 발행일이 있으면 추가
+    # 빈 본문(프록시 502 등)이면 json()이 None을 반환하므로 dict로 정규화
+    if not isinstance(result, dict):
+        result = {}
+    
+    if not result.get('ok'):
+        raise TelegramAPIError(
+            result.get('description', f"HTTP {response.status}"),
+            error_code=result.get('error_code', response.status),
+            retry_after=(result.get('parameters') or {}).get('retry_after')
+        )
+    return result['result']
+
+async def tg_send(session, token, chat_id, text, parse_mode=None):
+    """텔레그램 Bot API sendMessage를 aiohttp 세션으로 직접 호출"""
+    payload = {"chat_id": chat_id, "text": text}
+    if parse_mode:
+        payload["parse_mode"] = parse_mode
+    
+    try:
+        return await _tg_post(session, token, payload)
+    except TelegramAPIError as e:
+        if not e.retry_after:
+            raise
+        # 전송 한도 초과(429) 시 텔레그램이 알려준 시간만큼 기다린 뒤 재전송
+        logger.warning(f"텔레그램 전송 한도 초과, {e.retry_after}초 후 재전송합니다.")
+        await asyncio.sleep(e.retry_after + 0.5)
+        return await _tg_post(session, token, payload)
+
+async def get_session():
+    """모든 메시지 전송에 재사용할 HTTP 세션(커넥션 풀) 반환
+    
+    세션은 생성한 이벤트 루프에서만 사용할 수 있으므로 실행 중인 루프가 바뀌면 새로 생성
+    """
+    global _session, _session_loop, _session_closer
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(ssl=_SSL_CTX, limit=50, keepalive_timeout=60)
+        )
+        _session_loop = loop
+        # asyncio.run()은 종료 시 남은 태스크를 취소하므로 루프가 닫히기 전에 세션이 정리됨
+        _session_closer = loop.create_task(_close_on_shutdown(_session))
+    return _session
+
+async def _close_on_shutdown(session):
+    """이벤트 루프 종료(태스크 취소) 시 세션 닫기"""
+    try:
+        await asyncio.get_running_loop().create_future()
+    finally:
+        await session.close()
+
+async def close_session():
+    """공유 HTTP 세션 종료"""
+    global _session, _session_loop, _session_closer
+    if _session is not None:
+        await _session.close()
+        _session_closer.cancel()
+        _session = _session_loop = _session_closer = None
+
+def get_crawler():
+    """재사용할 뉴스 크롤러 반환"""
+    global _crawler
+    if _crawler is None:
+        _crawler = IndiaNewsCrawler()
+        logger.debug("뉴스 크롤러 초기화 완료")
+    return _crawler
+
+def escape_markdown(text):
+    """텔레그램 MarkdownV2 특수 문자 이스케이프"""
+    return str(text).translate(_MD_ESCAPE)
+
+def format_view_count(view_count):
+    """조회수를 1.2K, 3.4M 형식으로 변환"""
+    for threshold, suffix in _VIEW_UNITS:
+        if view_count >= threshold:
+            return f"{view_count / threshold:.1f}{suffix}"
+    return f"{view_count}"
+
+def format_article_message(article):
+    """기사 정보를 텔레그램 메시지(MarkdownV2) 형식으로 변환"""
+    category = article.get('category', '')
+    category_text = f" \\[{escape_markdown(category)}\\]" if category else ""
+
+    # 조회수 / 발행일(있으면) / 출처를 한 줄로
+    details = [f"👁 {format_view_count(article.get('views', 0))}"]
     if article.get('published_date'):
-        message += f"📅 발행일: {article['published_date']}\n"
+        details.append(f"📅 {article['published_date']}")
+    details.append(article['source'])
     
-    message += f"🔗 링크: {article['url']}\n"
-    message += f"출처: {article['source']}"
+    return (
+        f"📰 *{escape_markdown(article['title'])}*{category_text}\n"
+        f"{' | '.join(details).translate(_MD_ESCAPE)}\n"
+        f"🔗 {escape_markdown(article['url'])}"
+    )
+
+def format_digest(messages, max_chars=DIGEST_MAX_CHARS):
+    """기사 메시지들을 텔레그램 본문 한도 이내의 묶음 메시지로 나누어 생성
+    
+    (묶음 메시지, 묶음에 포함된 기사 수)를 순서대로 반환
+    """
+    chunk = ""
+    count = 0
+    for entry in messages:
+        if chunk and len(chunk) + len(DIGEST_SEPARATOR) + len(entry) > max_chars:
+            yield chunk, count
+            chunk = entry
+            count = 1
+        elif chunk:
+            chunk += DIGEST_SEPARATOR + entry
+            count += 1
+        else:
+            chunk = entry
+            count = 1
     
-    return message
+    if chunk:
+        yield chunk, count
+
+def canonicalize_url(url):
+    """중복 판별용 URL 정규화 (호스트 소문자, fragment 및 추적용 쿼리 파라미터 제거)"""
+    parts = urlsplit(url.strip())
+    query = urlencode([
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.startswith('utm_') and key not in TRACKING_PARAMS
+    ])
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ''))
+
+def load_seen_urls(path=BLOOM_FILE):
+    """이미 전송한 기사 URL의 Bloom filter 불러오기 (없으면 새로 생성)"""
+    if os.path.exists(path):
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.error(f"전송 기록 {path} 로드 중 오류: {str(e)}")
+    return ScalableBloomFilter(mode=ScalableBloomFilter.SMALL_SET_GROWTH)
+
+def save_seen_urls(seen_urls, path=BLOOM_FILE):
+    """전송한 기사 URL의 Bloom filter 저장"""
+    with open(path, 'wb') as f:
+        pickle.dump(seen_urls, f)
 
 def save_crawl_results(articles, filename=None):
     """크롤링 결과를 JSON 파일로 저장"""
-    if filename is None:
-        now = datetime.now()
-        filename = f"crawled_articles_{now.strftime('%Y%m%d_%H%M%S')}.json"
-    
-    # test_data 디렉토리 확인 및 생성
-    test_data_dir = os.path.join(os.getcwd(), 'test_data')
-    os.makedirs(test_data_dir, exist_ok=True)
+    filename = filename or f"crawled_articles_{int(time.time())}.json"
     
     # 파일 경로 생성
-    filepath = os.path.join(test_data_dir, filename)
+    filepath = _TEST_DATA_DIR / filename
     
-    # JSON 파일로 저장
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(articles, f, ensure_ascii=False, indent=2)
+    # JSON 배열 형식을 유지하면서 기사 단위로 직렬화해 순차 기록
+    with open(filepath, 'wb') as f:
+        f.write(b"[\n")
+        for i, article in enumerate(articles):
+            if i:
+                f.write(b",\n")
+            f.write(orjson.dumps(article, option=orjson.OPT_NON_STR_KEYS))
+        f.write(b"\n]")
     
     logger.info(f"크롤링 결과를 {filepath}에 저장했습니다.")
     return filepath
@@ -81,65 +266,80 @@ async def crawl_and_send_news():
     bot_token = os.getenv('TELEGRAM_BOT_TOKEN')
     chat_id = os.getenv('TELEGRAM_CHAT_ID')
     
-    logger.debug(f"환경 변수 확인 - 봇 토큰: {'설정됨' if bot_token else '없음'}, 채널 ID: {chat_id if chat_id else '없음'}")
+    logger.debug("환경 변수 확인 - 봇 토큰: %s, 채널 ID: %s", '설정됨' if bot_token else '없음', chat_id or '없음')
     
     if not bot_token or not chat_id:
         logger.error("환경 변수가 올바르게 설정되지 않았습니다. (TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID)")
         return False
     
+    session = await get_session()
+    
     try:
-        # 봇 초기화
-        bot = Bot(token=bot_token)
-        logger.debug("텔레그램 봇 초기화 완료")
-        
-        # 크롤러 초기화
-        crawler = IndiaNewsCrawler()
-        logger.debug("뉴스 크롤러 초기화 완료")
+        crawler = get_crawler()
         
         # 크롤링 시작 메시지 전송
-        await bot.send_message(chat_id=chat_id, text="기사 크롤링을 시작합니다. 잠시만 기다려주세요...")
+        await tg_send(session, bot_token, chat_id, "기사 크롤링을 시작합니다. 잠시만 기다려주세요...")
         logger.debug("크롤링 시작 메시지 전송 완료")
         
-        # Times of India 크롤링
+        # Times of India, Economic Times 동시 크롤링 (크롤러는 동기 코드이므로 스레드에서 실행)
         logger.info("Times of India 크롤링 시작")
-        try:
-            toi_articles = crawler.crawl_specific_website('times_of_india', max_articles=20)
-            logger.debug(f"Times of India 크롤링 결과: {len(toi_articles)}개 기사")
-            for i, article in enumerate(toi_articles):
-                logger.debug(f"TOI 기사 {i+1}: {article.get('title')} - {article.get('published_date')}")
-        except Exception as e:
-            logger.error(f"Times of India 크롤링 중 오류: {str(e)}")
-            toi_articles = []
-        
-        await bot.send_message(
-            chat_id=chat_id, 
-            text=f"Times of India에서 {len(toi_articles)}개의 기사를 가져왔습니다."
+        logger.info("Economic Times 크롤링 시작")
+        toi_articles, et_articles = await asyncio.gather(
+            asyncio.to_thread(crawler.crawl_specific_website, 'times_of_india', max_articles=20),
+            asyncio.to_thread(crawler.crawl_specific_website, 'economic_times', max_articles=20),
+            return_exceptions=True
         )
         
-        # Economic Times 크롤링
-        logger.info("Economic Times 크롤링 시작")
-        try:
-            et_articles = crawler.crawl_specific_website('economic_times', max_articles=20)
-            logger.debug(f"Economic Times 크롤링 결과: {len(et_articles)}개 기사")
-            for i, article in enumerate(et_articles):
-                logger.debug(f"ET 기사 {i+1}: {article.get('title')} - {article.get('published_date')}")
-        except Exception as e:
-            logger.error(f"Economic Times 크롤링 중 오류: {str(e)}")
+        if isinstance(toi_articles, Exception):
+            logger.error(f"Times of India 크롤링 중 오류: {str(toi_articles)}")
+            toi_articles = []
+        else:
+            logger.debug("Times of India 크롤링 결과: %d개 기사", len(toi_articles))
+        
+        if isinstance(et_articles, Exception):
+            logger.error(f"Economic Times 크롤링 중 오류: {str(et_articles)}")
             et_articles = []
+        else:
+            logger.debug("Economic Times 크롤링 결과: %d개 기사", len(et_articles))
         
-        await bot.send_message(
-            chat_id=chat_id, 
-            text=f"Economic Times에서 {len(et_articles)}개의 기사를 가져왔습니다."
+        await tg_send(
+            session, bot_token, chat_id,
+            f"Times of India에서 {len(toi_articles)}개의 기사를 가져왔습니다."
+        )
+        await tg_send(
+            session, bot_token, chat_id,
+            f"Economic Times에서 {len(et_articles)}개의 기사를 가져왔습니다."
         )
         
         # 모든 기사 통합
         all_articles = toi_articles + et_articles
-        logger.debug(f"총 {len(all_articles)}개의 기사 수집 완료")
+        
+        # 제목은 NFKC로 정규화(전각/호환 문자 정리)하고 길이 제한, URL은 공백 제거
+        for article in all_articles:
+            article['title'] = unicodedata.normalize('NFKC', article.get('title', ''))[:TITLE_MAX_CHARS]
+            article['url'] = article.get('url', '').strip()
+        crawled_count = len(all_articles)
+        logger.debug("총 %d개의 기사 수집 완료", crawled_count)
+        
+        # 이전 실행에서 전송했거나 이번에 중복 수집된 기사 제외
+        # (전송 기록에는 전송에 성공한 기사만 추가)
+        seen_urls = load_seen_urls()
+        new_articles = []
+        new_keys = []
+        batch_keys = set()
+        for article in all_articles:
+            url_key = canonicalize_url(article.get('url', ''))
+            if url_key not in seen_urls and url_key not in batch_keys:
+                batch_keys.add(url_key)
+                new_articles.append(article)
+                new_keys.append(url_key)
+        all_articles = new_articles
+        logger.info(f"중복 제외 후 새 기사 {len(all_articles)}개 (수집 {crawled_count}개)")
         
         # 크롤링 결과 저장
         try:
             saved_file = save_crawl_results(all_articles)
-            logger.debug(f"크롤링 결과 저장 완료: {saved_file}")
+            logger.debug("크롤링 결과 저장 완료: %s", saved_file)
         except Exception as e:
             logger.error(f"크롤링 결과 저장 중 오류: {str(e)}")
         
@@ -147,56 +347,65 @@ async def crawl_and_send_news():
         summary = f"""
 크롤링이 완료되었습니다!
 
-총 {len(all_articles)}개의 기사를 가져왔습니다:
+총 {crawled_count}개의 기사를 가져왔습니다:
 - Times of India: {len(toi_articles)}개
 - Economic Times: {len(et_articles)}개
+- 이 중 새 기사: {len(all_articles)}개
         """
-        await bot.send_message(chat_id=chat_id, text=summary)
+        await tg_send(session, bot_token, chat_id, summary)
+        
+        # 기사 메시지는 전송 전에 한 번만 생성 (특수 문자는 이스케이프되어 있음)
+        messages = [format_article_message(article) for article in all_articles]
         
-        # 각 기사 개별 전송
+        # 기사를 여러 개씩 묶어 전송 (메시지 수를 줄여 전송 한도 회피)
         logger.info(f"총 {len(all_articles)}개의 기사를 채널로 전송합니다.")
-        for i, article in enumerate(all_articles, 1):
-            message = format_article_message(article)
+        start = 0
+        for i, (message, count) in enumerate(format_digest(messages), 1):
+            chunk_keys = new_keys[start:start + count]
+            start += count
+            if i > 1:
+                await asyncio.sleep(DIGEST_INTERVAL)
             try:
-                logger.debug(f"기사 {i}/{len(all_articles)} 전송 시도")
-                await bot.send_message(chat_id=chat_id, text=message, parse_mode='Markdown')
-                logger.debug(f"기사 {i} 전송 성공")
-                await asyncio.sleep(1)  # 1초 대기
+                logger.debug("기사 묶음 %d 전송 시도", i)
+                await tg_send(session, bot_token, chat_id, message, parse_mode='MarkdownV2')
+                logger.debug("기사 묶음 %d 전송 성공", i)
             except Exception as e:
-                logger.error(f"기사 {i} 전송 중 오류 발생: {str(e)}")
-                try:
-                    # Markdown 파싱 오류 시 일반 텍스트로 재시도
-                    await bot.send_message(chat_id=chat_id, text=message)
-                    logger.debug(f"기사 {i} 일반 텍스트로 재전송 성공")
-                except Exception as e2:
-                    logger.error(f"기사 {i} 재전송 중 오류 발생: {str(e2)}")
-                await asyncio.sleep(1)  # 1초 대기
+                # 전송 기록에 남기지 않아 다음 실행에서 다시 전송
+                logger.error(f"기사 묶음 {i} 전송 중 오류 발생: {str(e)}")
+                continue
+            for url_key in chunk_keys:
+                seen_urls.add(url_key)
+        
+        # 전송한 기사 URL 기록 저장
+        try:
+            save_seen_urls(seen_urls)
+        except Exception as e:
+            logger.error(f"전송 기록 저장 중 오류: {str(e)}")
         
         logger.info("모든 기사 전송 완료")
         return True
         
     except Exception as e:
         logger.exception(f"뉴스 크롤링 및 전송 중 오류 발생: {str(e)}")
-        if 'bot' in locals() and 'chat_id' in locals():
-            try:
-                await bot.send_message(
-                    chat_id=chat_id, 
-                    text=f"뉴스 크롤링 및 전송 중 오류가 발생했습니다: {str(e)}"
-                )
-            except Exception as e2:
-                logger.error(f"오류 메시지 전송 실패: {str(e2)}")
+        try:
+            await tg_send(
+                session, bot_token, chat_id,
+                f"뉴스 크롤링 및 전송 중 오류가 발생했습니다: {str(e)}"
+            )
+        except Exception as e2:
+            logger.error(f"오류 메시지 전송 실패: {str(e2)}")
         return False
 
 def main():
     """메인 함수"""
     logger.info("인도 뉴스 전송 스크립트 시작")
     
+    # 더 빠른 이벤트 루프 사용 (asyncio.run이 이 정책으로 루프를 생성)
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     try:
-        # Python 3.12 이상에서는 새로운 이벤트 루프 생성 방식 사용
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        result = loop.run_until_complete(crawl_and_send_news())
-        loop.close()
+        result = asyncio.run(crawl_and_send_news())
         
         if result:
             logger.info("뉴스 크롤링 및 전송이 성공적으로 완료되었습니다.")